@@ -2,15 +2,17 @@
 Tracking System Demo
 Shows how duplicate uploads are prevented
 """
-import json
+from tracking_store import TrackingStore
 
 print("=" * 80)
 print("Tracking System Explanation")
 print("=" * 80)
 
-# Load current tracking
-with open('tracking.json', 'r') as f:
-    tracking = json.load(f)
+# Load current tracking (tracking.sqlite; an old tracking.json is
+# migrated into it automatically on first open)
+store = TrackingStore('tracking.sqlite')
+tracking = store.load()
+store.close()
 
 print("\n📊 Current Tracking Status:")
 print(f"Channel: {tracking.get('channel_url', 'Not set')}")
@@ -44,7 +46,7 @@ print("""
    - "completed" videos automatically SKIP ho jate hain
    - Only "pending" videos consider hote hain
 
-Example tracking.json structure:
+Example tracking entry (stored per-video in tracking.sqlite):
 {
   "videos": {
     "VIDEO_ID_1": {
@@ -74,9 +76,9 @@ print("""
 # Show current status
 python main.py --status
 
-# Manually view tracking file
-cat tracking.json
+# Manually view tracking database
+sqlite3 tracking.sqlite "SELECT id, status FROM videos"
 
 # Check specific video
-python -c "import json; t=json.load(open('tracking.json')); print(json.dumps(t['videos']['VIDEO_ID'], indent=2))"
+python -c "from tracking_store import TrackingStore; import json; t=TrackingStore().load(); print(json.dumps(t['videos']['VIDEO_ID'], indent=2))"
 """)
@@ -6,19 +6,28 @@ Key Features:
 - Only processes segments that need to be uploaded (not all)
 - Resumes from where it left off
 - Max 3 uploads per run
-- Tracks progress in tracking.json
+- Tracks progress in tracking.sqlite (migrated automatically from tracking.json)
 """
 import argparse
+import io
 import json
 import os
 import logging
+import random
 import shutil
+import subprocess
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from modules.scraper import get_channel_videos
 from modules.downloader import VideoDownloader
 from modules.splitter import VideoSplitter
 from modules.editor import VideoEditor
 from modules.youtube_uploader import YouTubeUploader
+from tracking_store import TrackingStore
+from googleapiclient.errors import HttpError
 
 # Setup logging
 os.makedirs('logs', exist_ok=True)
@@ -33,28 +42,97 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class QuotaExceededError(Exception):
+    """Raised when YouTube reports the daily upload quota is exhausted"""
+
+
+def _process_segment_job(config: dict, video_path: str, part_num: int,
+                         start_time: float, duration: float,
+                         segment_path: str, edited_path: str, title: str):
+    """
+    Create one raw segment with FFmpeg, then edit it (overlay + 9:16).
+    Runs in a worker process, so it only takes picklable arguments and
+    builds its own VideoEditor from the config dict.
+    """
+    ffmpeg_threads = config['video_settings'].get('ffmpeg_threads', 2)
+    x264_preset = config['video_settings'].get('x264_preset', 'veryfast')
+
+    cmd = [
+        'ffmpeg', '-y',
+        '-ss', str(start_time),
+        '-i', video_path,
+        '-t', str(duration),
+        '-c:v', 'libx264',
+        '-preset', x264_preset,
+        '-c:a', 'aac',
+        '-b:a', '256k',  # Good audio quality
+        '-threads', str(ffmpeg_threads),
+        '-loglevel', 'error',
+        segment_path
+    ]
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        logger.error(f"Failed to create segment {part_num}: {result.stderr}")
+        return None
+
+    if config['youtube_upload'].get('stream_uploads', False):
+        # Editing happens at upload time, piped straight into the request,
+        # so the raw segment is all this job needs to produce
+        return segment_path
+
+    # Edit segment (add overlay, convert to 9:16)
+    editor = VideoEditor(config)
+    edited_result = editor.add_overlays(segment_path, part_num, title, edited_path)
+
+    # Clean up raw segment to save space
+    if edited_result and os.path.exists(segment_path):
+        os.remove(segment_path)
+
+    return edited_result
+
+
 class YouTubeShortsAutomation:
-    def __init__(self, config_path: str = 'config.json', tracking_path: str = 'tracking.json'):
+    def __init__(self, config_path: str = 'config.json', tracking_path: str = 'tracking.sqlite'):
         # Load configuration
         with open(config_path, 'r', encoding='utf-8') as f:
             self.config = json.load(f)
-        
+
         self.tracking_path = tracking_path
+        self.store = TrackingStore(tracking_path)
         self.tracking = self._load_tracking()
+
+        # status -> ordered video_ids, so "next pending" is O(1) instead of
+        # a scan over every tracked video
+        self._by_status = defaultdict(deque)
+        for vid, data in self.tracking['videos'].items():
+            self._by_status[data.get('status', 'pending')].append(vid)
         
         # Create directories
         for path in self.config['paths'].values():
             os.makedirs(path, exist_ok=True)
         
         # Initialize modules
-        self.downloader = VideoDownloader(self.config['paths']['downloads'])
+        download_config = self.config.get('download', {})
+        self.downloader = VideoDownloader(self.config['paths']['downloads'], download_config)
+
+        # Cap simultaneous video downloads (foreground + prefetch)
+        self._download_sem = threading.BoundedSemaphore(
+            download_config.get('max_parallel_videos', 2)
+        )
         self.splitter = VideoSplitter(self.config['paths']['processed'])
         self.editor = VideoEditor(self.config)
         
         # YouTube uploader (lazy init)
         self._uploader = None
+        self._quota_hit = False
+        self._prefetch_thread = None
         
         # Get limits from config
+        # Upload templates, bound once - identical for every segment
+        self._title_tmpl = self.config['youtube_upload']['title_template']
+        self._desc_tmpl = self.config['youtube_upload']['description_template']
+
         self.max_uploads_per_run = self.config['video_settings'].get('max_uploads_per_run', 3)
         self.max_segments_per_video = self.config['video_settings'].get('max_segments_per_video', 10)
         self.segment_duration = self.config['video_settings'].get('segment_duration_seconds', 60)
@@ -67,17 +145,25 @@ class YouTubeShortsAutomation:
             self._uploader = YouTubeUploader(credentials_file)
         return self._uploader
     
+    def _set_status(self, video_id: str, new_status: str):
+        """Update a video's status and keep the status index in sync"""
+        old_status = self.tracking['videos'][video_id].get('status')
+        if old_status == new_status:
+            return
+        try:
+            self._by_status[old_status].remove(video_id)
+        except ValueError:
+            pass
+        self._by_status[new_status].append(video_id)
+        self.tracking['videos'][video_id]['status'] = new_status
+
     def _load_tracking(self) -> dict:
         """Load tracking database"""
-        if os.path.exists(self.tracking_path):
-            with open(self.tracking_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {'channel_url': '', 'last_scrape': None, 'videos': {}}
-    
-    def _save_tracking(self):
-        """Save tracking database"""
-        with open(self.tracking_path, 'w', encoding='utf-8') as f:
-            json.dump(self.tracking, f, indent=2, ensure_ascii=False)
+        return self.store.load()
+
+    def _save_tracking(self, video_id: str = None):
+        """Save tracking database (only the given video's row when specified)"""
+        self.store.save(self.tracking, video_id)
     
     def scrape_channel(self, channel_url: str = None):
         """Scrape YouTube channel and update tracking (sorted by date - newest first)"""
@@ -107,6 +193,7 @@ class YouTubeShortsAutomation:
                     'downloaded_at': None,
                     'last_upload': None
                 }
+                self._by_status['pending'].append(video_id)
             else:
                 # Update views and published date
                 self.tracking['videos'][video_id]['views'] = video['views']
@@ -122,18 +209,21 @@ class YouTubeShortsAutomation:
         Priority: partial (resume) > pending (new)
         Returns: (video_id, video_data) or (None, None)
         """
-        # First, look for partial videos (resume upload)
-        for video_id, data in self.tracking['videos'].items():
-            if data.get('status') == 'partial':
+        # First, look for partial / quota-deferred videos (resume upload)
+        for status in ('partial', 'quota_deferred'):
+            if self._by_status[status]:
+                video_id = self._by_status[status][0]
+                data = self.tracking['videos'][video_id]
                 logger.info(f"📌 Resuming partial video: {data['title']}")
                 return video_id, data
-        
+
         # Then, look for pending videos (new)
-        for video_id, data in self.tracking['videos'].items():
-            if data.get('status') == 'pending':
-                logger.info(f"📌 Starting new video: {data['title']}")
-                return video_id, data
-        
+        if self._by_status['pending']:
+            video_id = self._by_status['pending'][0]
+            data = self.tracking['videos'][video_id]
+            logger.info(f"📌 Starting new video: {data['title']}")
+            return video_id, data
+
         logger.info("✅ All videos completed!")
         return None, None
     
@@ -169,17 +259,22 @@ class YouTubeShortsAutomation:
         
         if not os.path.exists(video_path):
             logger.info(f"\n📥 Downloading video...")
-            video_path = self.downloader.download_video(
-                video_data['url'],
-                video_id,
-                prefer_hindi=False  # English audio
-            )
+            with self._download_sem:
+                video_path = self.downloader.download_video(
+                    video_data['url'],
+                    video_id,
+                    prefer_hindi=False  # English audio
+                )
             if not video_path:
                 logger.error("Download failed!")
                 return
         else:
             logger.info(f"✓ Video already downloaded: {video_path}")
-        
+
+        # Overlap I/O with compute: start downloading the next pending video
+        # while this one is being encoded and uploaded
+        self._start_prefetch(video_id)
+
         # 4. Calculate which parts to process
         parts_already_uploaded = video_data.get('parts_uploaded', [])
         next_part_to_upload = max(parts_already_uploaded) + 1 if parts_already_uploaded else 1
@@ -204,9 +299,11 @@ class YouTubeShortsAutomation:
         # Check if video is already complete
         if next_part_to_upload > total_parts:
             logger.info(f"✅ Video already complete! Moving to next video...")
-            self.tracking['videos'][video_id]['status'] = 'completed'
-            self._save_tracking()
-            # Recursively process next video
+            self._set_status(video_id, 'completed')
+            self._save_tracking(video_id)
+            # Recursively process next video (its download may already be
+            # prefetched by now)
+            self._join_prefetch()
             return self.run_full_automation()
         
         # 5. Calculate which parts to process THIS RUN
@@ -218,128 +315,87 @@ class YouTubeShortsAutomation:
         
         logger.info(f"\n🎯 This run will process parts: {parts_to_process}")
         
-        # 6. Create ONLY the segments we need
+        # 6. Create ONLY the segments we need (in parallel - each FFmpeg job
+        # is largely single-threaded on the filter graph, so run N at once)
         logger.info(f"\n✂️ Creating only required segments...")
         processed_dir = self.config['paths']['processed']
-        
+
         segments_to_upload = []
-        
-        for part_num in parts_to_process:
-            # Calculate time range for this segment
-            start_time = (part_num - 1) * self.segment_duration
-            end_time = min(part_num * self.segment_duration, total_duration)
-            
-            # Create segment filename
-            segment_filename = f"{video_id}_part{part_num}.mp4"
-            segment_path = os.path.join(processed_dir, segment_filename)
-            edited_filename = f"{video_id}_part{part_num}_edited.mp4"
-            edited_path = os.path.join(processed_dir, edited_filename)
-            
-            # Create segment using FFmpeg
-            logger.info(f"\n--- Part {part_num} ---")
-            logger.info(f"Creating segment: {start_time:.2f}s - {end_time:.2f}s")
-            
-            import subprocess
-            cmd = [
-                'ffmpeg', '-y',
-                '-ss', str(start_time),
-                '-i', video_path,
-                '-t', str(end_time - start_time),
-                '-c:v', 'libx264',
-                '-preset', 'slow',  # Good quality encoding
-                '-c:a', 'aac',
-                '-b:a', '256k',  # Good audio quality
-                '-loglevel', 'error',
-                segment_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error(f"Failed to create segment {part_num}: {result.stderr}")
-                continue
-            
-            logger.info(f"✓ Segment {part_num} created")
-            
-            # Edit segment (add overlay, convert to 9:16)
-            logger.info(f"Editing segment {part_num}...")
-            edited_result = self.editor.add_overlays(
-                segment_path, 
-                part_num, 
-                video_data['title'],
-                edited_path
-            )
-            
-            if edited_result:
-                logger.info(f"✓ Segment {part_num} edited")
-                segments_to_upload.append((edited_path, part_num, video_data['title']))
-                
-                # Clean up raw segment to save space
-                if os.path.exists(segment_path):
-                    os.remove(segment_path)
-            else:
-                logger.error(f"Failed to edit segment {part_num}")
+
+        ffmpeg_threads = self.config['video_settings'].get('ffmpeg_threads', 2)
+        max_workers = max(1, (os.cpu_count() or 1) // ffmpeg_threads)
+        max_workers = min(max_workers, len(parts_to_process))
+
+        logger.info(f"Encoding {len(parts_to_process)} segments with {max_workers} parallel workers...")
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for part_num in parts_to_process:
+                # Calculate time range for this segment
+                start_time = (part_num - 1) * self.segment_duration
+                end_time = min(part_num * self.segment_duration, total_duration)
+
+                # Create segment filename
+                segment_filename = f"{video_id}_part{part_num}.mp4"
+                segment_path = os.path.join(processed_dir, segment_filename)
+                edited_filename = f"{video_id}_part{part_num}_edited.mp4"
+                edited_path = os.path.join(processed_dir, edited_filename)
+
+                logger.info(f"Queueing part {part_num}: {start_time:.2f}s - {end_time:.2f}s")
+                futures[part_num] = executor.submit(
+                    _process_segment_job,
+                    self.config, video_path, part_num,
+                    start_time, end_time - start_time,
+                    segment_path, edited_path, video_data['title']
+                )
+
+            # Collect results in part order
+            for part_num in parts_to_process:
+                edited_result = futures[part_num].result()
+                if edited_result:
+                    logger.info(f"✓ Segment {part_num} created and edited")
+                    segments_to_upload.append((edited_result, part_num, video_data['title']))
+                else:
+                    logger.error(f"Failed to process segment {part_num}")
         
         if not segments_to_upload:
             logger.error("No segments to upload!")
+            self._join_prefetch()
             return
         
-        # 7. Upload segments
+        # 7. Upload segments (a few in flight at once - each resumable upload
+        # spends most of its time waiting on the network)
         logger.info(f"\n📤 Uploading {len(segments_to_upload)} segments to YouTube...")
-        
+
         upload_config = self.config['youtube_upload']
         uploaded_parts = list(parts_already_uploaded)  # Copy existing
         uploaded_ids = list(video_data.get('youtube_video_ids', []))
-        
-        for edited_path, part_num, title in segments_to_upload:
-            # Generate title and description
-            upload_title = upload_config['title_template'].format(
-                title=title,
-                part=part_num
-            )
-            
-            # Ensure title doesn't exceed 99 characters (YouTube limit is 100)
-            if len(upload_title) > 99:
-                # Calculate how much to trim from the original title
-                hashtags = " #shorts #viral #mrbeast"
-                part_text = f" - Part {part_num}"
-                available_chars = 99 - len(hashtags) - len(part_text) - 3  # -3 for "..."
-                truncated_title = title[:available_chars] + "..."
-                upload_title = f"{truncated_title}{part_text}{hashtags}"
-                logger.info(f"Title truncated to {len(upload_title)} chars")
-            
-            upload_description = upload_config['description_template'].format(
-                title=title,
-                part=part_num,
-                total=total_parts,
-                url=video_data['url']
-            )
-            
-            # Upload
-            try:
-                yt_video_id = self.uploader.upload_short(
-                    video_path=edited_path,
-                    title=upload_title,
-                    description=upload_description,
-                    tags=upload_config['tags'],
-                    category_id=upload_config['category_id'],
-                    privacy_status=upload_config['privacy_status']
+
+        # Force authentication once in the main thread before fanning out
+        _ = self.uploader
+        self._quota_hit = False
+
+        max_concurrent = upload_config.get('max_concurrent_uploads', 2)
+        max_concurrent = max(1, min(max_concurrent, len(segments_to_upload)))
+
+        with ThreadPoolExecutor(max_workers=max_concurrent) as pool:
+            futures = [
+                pool.submit(
+                    self._upload_segment,
+                    edited_path, part_num, title, total_parts, video_data['url']
                 )
-                
+                for edited_path, part_num, title in segments_to_upload
+            ]
+
+            for future in futures:
+                part_num, yt_video_id = future.result()
                 if yt_video_id:
                     uploaded_parts.append(part_num)
                     uploaded_ids.append(yt_video_id)
                     logger.info(f"✓ Part {part_num} uploaded: https://youtube.com/shorts/{yt_video_id}")
                 else:
                     logger.error(f"✗ Part {part_num} upload failed")
-                
-                    
-            except Exception as e:
-                logger.error(f"Error uploading part {part_num}: {e}")
-            
-            # Clean up edited segment after upload
-            if os.path.exists(edited_path):
-                os.remove(edited_path)
-        
+
         # 8. Update tracking
         self.tracking['videos'][video_id]['parts_uploaded'] = sorted(uploaded_parts)
         self.tracking['videos'][video_id]['total_parts'] = total_parts
@@ -348,15 +404,18 @@ class YouTubeShortsAutomation:
         
         # Check if video is now complete
         if len(uploaded_parts) >= total_parts:
-            self.tracking['videos'][video_id]['status'] = 'completed'
+            self._set_status(video_id, 'completed')
             logger.info(f"\n🎉 Video COMPLETED! All {total_parts} parts uploaded.")
+        elif self._quota_hit:
+            self._set_status(video_id, 'quota_deferred')
+            logger.info(f"\n⏸️ Upload quota exhausted - remaining parts deferred to the next run")
         else:
-            self.tracking['videos'][video_id]['status'] = 'partial'
+            self._set_status(video_id, 'partial')
             remaining = total_parts - len(uploaded_parts)
             logger.info(f"\n📊 Progress: {len(uploaded_parts)}/{total_parts} parts uploaded")
             logger.info(f"   Remaining: {remaining} parts")
-        
-        self._save_tracking()
+
+        self._save_tracking(video_id)
         
         # Summary
         logger.info("\n" + "=" * 60)
@@ -366,7 +425,157 @@ class YouTubeShortsAutomation:
         logger.info(f"Parts uploaded this run: {parts_to_process}")
         logger.info(f"Total parts uploaded: {len(uploaded_parts)}/{total_parts}")
         logger.info(f"Status: {self.tracking['videos'][video_id]['status']}")
+
+        self._join_prefetch()
     
+    def _start_prefetch(self, current_video_id: str):
+        """
+        Download the next pending video in the background so the network
+        works while this run's FFmpeg encodes and uploads keep the CPU busy.
+        """
+        next_vid = None
+        for vid in self._by_status['pending']:
+            if vid != current_video_id:
+                next_vid = vid
+                break
+        if next_vid is None:
+            return
+
+        next_path = os.path.join(self.config['paths']['downloads'], f"{next_vid}.mp4")
+        if os.path.exists(next_path):
+            return
+
+        next_url = self.tracking['videos'][next_vid]['url']
+
+        def _download():
+            logger.info(f"📥 Prefetching next video in background: {next_vid}")
+            try:
+                with self._download_sem:
+                    self.downloader.download_video(next_url, next_vid, prefer_hindi=False)
+            except Exception as e:
+                logger.warning(f"Prefetch of {next_vid} failed: {e}")
+
+        self._prefetch_thread = threading.Thread(
+            target=_download, name='prefetch-download', daemon=True
+        )
+        self._prefetch_thread.start()
+
+    def _join_prefetch(self):
+        """Wait for a background prefetch (if any) before the run ends"""
+        if self._prefetch_thread is not None:
+            if self._prefetch_thread.is_alive():
+                logger.info("Waiting for background prefetch to finish...")
+            self._prefetch_thread.join()
+            self._prefetch_thread = None
+
+    def _upload_segment(self, edited_path: str, part_num: int, title: str,
+                        total_parts: int, video_url: str) -> tuple:
+        """
+        Upload a single edited segment.
+        Returns (part_num, youtube_video_id or None).
+        """
+        upload_config = self.config['youtube_upload']
+
+        # Generate title and description
+        upload_title = self._title_tmpl.format_map({'title': title, 'part': part_num})
+
+        # Ensure title doesn't exceed 99 characters (YouTube limit is 100)
+        if len(upload_title) > 99:
+            # Calculate how much to trim from the original title
+            hashtags = " #shorts #viral #mrbeast"
+            part_text = f" - Part {part_num}"
+            available_chars = 99 - len(hashtags) - len(part_text) - 3  # -3 for "..."
+            truncated_title = title[:available_chars] + "..."
+            upload_title = f"{truncated_title}{part_text}{hashtags}"
+            logger.info(f"Title truncated to {len(upload_title)} chars")
+
+        upload_description = self._desc_tmpl.format_map({
+            'title': title,
+            'part': part_num,
+            'total': total_parts,
+            'url': video_url
+        })
+
+        # Upload (with backoff on transient API errors)
+        upload_kwargs = dict(
+            title=upload_title,
+            description=upload_description,
+            tags=upload_config['tags'],
+            category_id=upload_config['category_id'],
+            privacy_status=upload_config['privacy_status']
+        )
+
+        yt_video_id = None
+        try:
+            if upload_config.get('stream_uploads', False):
+                # edited_path is the raw segment here: edit it on the fly and
+                # hand the MP4 bytes to the uploader without touching disk
+                buffer = self._edit_to_buffer(edited_path, part_num)
+                if buffer is not None:
+                    yt_video_id = self._upload_with_retry(
+                        part_num, video_stream=buffer, **upload_kwargs
+                    )
+            else:
+                yt_video_id = self._upload_with_retry(
+                    part_num, video_path=edited_path, **upload_kwargs
+                )
+        except QuotaExceededError as e:
+            logger.error(f"✗ Part {part_num}: {e}")
+            self._quota_hit = True
+        except Exception as e:
+            logger.error(f"Error uploading part {part_num}: {e}")
+
+        # Clean up edited segment after upload
+        if os.path.exists(edited_path):
+            os.remove(edited_path)
+
+        return part_num, yt_video_id
+
+    def _edit_to_buffer(self, segment_path: str, part_num: int):
+        """
+        Edit a raw segment via FFmpeg's stdout pipe and capture the
+        fragmented MP4 in memory (seekable, so resumable upload retries work).
+        Returns an io.BytesIO or None on failure.
+        """
+        proc = self.editor.open_edit_stream(segment_path, part_num)
+        if proc is None:
+            return None
+
+        data = proc.stdout.read()
+        proc.stdout.close()
+
+        if proc.wait() != 0 or len(data) < 1000:
+            logger.error(f"Streaming edit failed for part {part_num}")
+            return None
+
+        return io.BytesIO(data)
+
+    def _upload_with_retry(self, part_num: int, attempts: int = 3, **upload_kwargs):
+        """
+        Upload with exponential backoff + jitter on transient HTTP errors.
+        Quota exhaustion (403 quotaExceeded) is never retried - it won't
+        clear until the daily reset, so the part is deferred instead.
+        """
+        for attempt in range(attempts):
+            try:
+                return self.uploader.upload_short(**upload_kwargs)
+            except HttpError as e:
+                status = getattr(e.resp, 'status', None)
+
+                if status == 403 and b'quotaExceeded' in (e.content or b''):
+                    raise QuotaExceededError("daily upload quota exhausted")
+
+                if status in (429, 500, 502, 503, 504) and attempt < attempts - 1:
+                    wait = (2 ** attempt) + random.random()
+                    logger.warning(
+                        f"Transient error {status} uploading part {part_num}, "
+                        f"retrying in {wait:.1f}s (attempt {attempt + 1}/{attempts})..."
+                    )
+                    time.sleep(wait)
+                    continue
+
+                raise
+
     def show_status(self):
         """Show current tracking status"""
         print("\n" + "=" * 60)
@@ -376,37 +585,28 @@ class YouTubeShortsAutomation:
         print(f"Last Scrape: {self.tracking.get('last_scrape', 'Never')}")
         print(f"\nTotal Videos: {len(self.tracking.get('videos', {}))}")
         
-        # Count by status
-        status_counts = {}
-        for video_data in self.tracking.get('videos', {}).values():
-            status = video_data.get('status', 'unknown')
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
+        # Count by status (index keeps counts without a full scan)
         print("\nStatus Breakdown:")
-        for status, count in status_counts.items():
-            emoji = {'completed': '✅', 'partial': '🔄', 'pending': '⏳'}.get(status, '❓')
-            print(f"  {emoji} {status}: {count}")
-        
+        for status, queue in self._by_status.items():
+            if not queue:
+                continue
+            emoji = {'completed': '✅', 'partial': '🔄', 'pending': '⏳', 'quota_deferred': '⏸️'}.get(status, '❓')
+            print(f"  {emoji} {status}: {len(queue)}")
+
         # Show partial videos (in progress)
-        partial = [
-            (vid, data) for vid, data in self.tracking.get('videos', {}).items()
-            if data.get('status') == 'partial'
-        ]
-        if partial:
+        if self._by_status['partial']:
             print("\n🔄 In Progress:")
-            for vid, data in partial:
+            for vid in self._by_status['partial']:
+                data = self.tracking['videos'][vid]
                 uploaded = len(data.get('parts_uploaded', []))
                 total = data.get('total_parts', '?')
                 print(f"  • {data['title']}")
                 print(f"    Progress: {uploaded}/{total} parts")
-        
+
         # Show next pending
-        pending = [
-            (vid, data) for vid, data in self.tracking.get('videos', {}).items()
-            if data.get('status') == 'pending'
-        ]
-        if pending:
-            print(f"\n⏳ Next Pending: {pending[0][1]['title']}")
+        if self._by_status['pending']:
+            next_vid = self._by_status['pending'][0]
+            print(f"\n⏳ Next Pending: {self.tracking['videos'][next_vid]['title']}")
 
 
 def main():
@@ -12,8 +12,9 @@ logger = logging.getLogger(__name__)
 
 
 class VideoDownloader:
-    def __init__(self, download_dir: str = "downloads"):
+    def __init__(self, download_dir: str = "downloads", download_config: dict = None):
         self.download_dir = download_dir
+        self.download_config = download_config or {}
         os.makedirs(download_dir, exist_ok=True)
     
     def download_video(self, video_url: str, video_id: str, prefer_hindi: bool = True) -> Optional[str]:
@@ -47,12 +48,22 @@ class VideoDownloader:
             'format': format_str,
             'outtmpl': output_path,
             'merge_output_format': 'mp4',
+            # Fetch DASH fragments in parallel - one TCP flow rarely saturates the link
+            'concurrent_fragment_downloads': self.download_config.get('concurrent_fragments', 8),
+            # Pause between requests to stay under YouTube's rate limits
+            'sleep_interval': self.download_config.get('sleep_interval', 3),
+            'max_sleep_interval': self.download_config.get('max_sleep_interval', 10),
             'quiet': False,
             'no_warnings': False,
             'logger': logger,
             'progress_hooks': [self._progress_hook],
         }
-        
+
+        # Optional bandwidth cap (bytes/sec) to avoid tripping throttling
+        rate_limit = self.download_config.get('rate_limit_bytes')
+        if rate_limit:
+            ydl_opts['ratelimit'] = rate_limit
+
         try:
             logger.info(f"Downloading video: {video_url}")
             # Check for cookies file
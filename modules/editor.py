@@ -5,41 +5,92 @@ Supports Split Screen (Gameplay Bottom) to avoid reused content issues
 """
 import subprocess
 import os
+import functools
+import hashlib
+import json
 import logging
 import random
-from PIL import Image, ImageDraw, ImageFont
+import tempfile
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _probe_video(video_path: str, mtime: float) -> tuple:
+    """Run a single ffprobe call returning (width, height, duration)"""
+    # One JSON probe for both stream and format info (instead of two spawns)
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'stream=width,height:format=duration',
+        '-of', 'json',
+        video_path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    data = json.loads(result.stdout)
+
+    stream = data.get('streams', [{}])[0]
+    width = int(stream.get('width') or 1920)
+    height = int(stream.get('height') or 1080)
+    duration = float(data.get('format', {}).get('duration') or 60)
+
+    return width, height, duration
+
+
+def _test_encode(encoder: str) -> bool:
+    """
+    One-frame test encode to verify an encoder actually works here.
+    '-encoders' only reports what the FFmpeg build was compiled with;
+    distro builds list h264_nvenc/h264_qsv even on machines without the
+    GPU or driver, where every real encode would fail.
+    """
+    cmd = [
+        'ffmpeg', '-hide_banner', '-f', 'lavfi', '-i', 'color=black:s=64x64',
+        '-frames:v', '1', '-c:v', encoder, '-f', 'null', '-'
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=15)
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def detect_hw_encoder() -> str:
+    """
+    Pick the best available hardware H.264 encoder, or '' for CPU x264.
+    Only encoders that accept system-memory frames are considered, so the
+    existing CPU filter graphs keep working unchanged. Candidates must
+    pass a test encode, not just appear in the build's encoder list.
+    """
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=10
+        )
+        available = result.stdout
+    except Exception as e:
+        logger.warning(f"Could not probe FFmpeg encoders: {e}")
+        return ''
+
+    for encoder in ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox'):
+        if encoder not in available:
+            continue
+        if _test_encode(encoder):
+            logger.info(f"Using hardware encoder: {encoder}")
+            return encoder
+        logger.info(f"{encoder} is compiled in but failed a test encode, skipping")
+
+    return ''
+
+
 def get_video_info(video_path: str) -> dict:
-    """Get video dimensions and duration using ffprobe"""
+    """Get video dimensions and duration using ffprobe (cached per file mtime)"""
     try:
-        # Get video stream info
-        cmd = [
-            'ffprobe', '-v', 'error',
-            '-select_streams', 'v:0',
-            '-show_entries', 'stream=width,height',
-            '-of', 'csv=p=0:s=x',
-            video_path
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        dimensions = result.stdout.strip().split('x')
-        
-        width = int(dimensions[0]) if dimensions[0] else 1920
-        height = int(dimensions[1]) if len(dimensions) > 1 and dimensions[1] else 1080
-        
-        # Get duration
-        cmd_dur = [
-            'ffprobe', '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            video_path
-        ]
-        result_dur = subprocess.run(cmd_dur, capture_output=True, text=True)
-        duration = float(result_dur.stdout.strip()) if result_dur.stdout.strip() else 60
-        
+        mtime = os.path.getmtime(video_path)
+        width, height, duration = _probe_video(video_path, mtime)
         return {'width': width, 'height': height, 'duration': duration}
     except Exception as e:
         logger.error(f"Error getting video info: {e}")
@@ -47,41 +98,98 @@ def get_video_info(video_path: str) -> dict:
 
 
 class VideoEditor:
+    # Candidate fonts for the "Part N" header (Windows and Linux locations)
+    FONT_PATHS = [
+        "arialbd.ttf",
+        "arial.ttf",
+        "C:/Windows/Fonts/arialbd.ttf",
+        "C:/Windows/Fonts/arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+    ]
+
     def __init__(self, config: dict):
         self.config = config
         self.overlay_settings = config.get('overlay_settings', {})
         self.video_settings = config.get('video_settings', {})
         self.split_screen_config = self.video_settings.get('split_screen', {'enabled': False})
-    
-    def _create_text_overlay(self, text: str, width: int, height: int = 200) -> str:
-        """Create a text overlay image using PIL"""
-        # Create transparent image
-        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Load font
+        self.overlay_cache_dir = 'overlays_cache'
+        # Preload the overlay font once - parsing OpenType tables per segment
+        # is identical, wasted work
+        self._fonts = {}
+        self._font = self._resolve_font(self.overlay_settings.get('part_text_size', 80))
+        self._gameplay_files = None
+        self._gameplay_durations = {}
+        self.hw_encoder = detect_hw_encoder() if self.video_settings.get('hw_accel', True) else ''
+        self._font_file = self._find_font_file()
+
+    def _find_font_file(self):
+        """Locate a TrueType font file for FFmpeg's drawtext filter (once, at init)"""
+        for font_path in self.FONT_PATHS:
+            if os.path.exists(font_path):
+                return font_path
+        return None
+
+    def _drawtext_filter(self, text: str) -> str:
+        """Build a native drawtext stage for the 'Part N' header"""
         font_size = self.overlay_settings.get('part_text_size', 80)
+        escaped = text.replace('\\', '\\\\').replace("'", "\\'").replace(':', '\\:')
+        font_file = self._font_file.replace('\\', '/').replace(':', '\\:')
+        return (
+            f"drawtext=fontfile='{font_file}':text='{escaped}':"
+            f"fontsize={font_size}:fontcolor=white:borderw=3:bordercolor=black:"
+            f"x=(w-text_w)/2:y=50"
+        )
+
+    def _encoder_args(self) -> list:
+        """Encoder options for the output video stream"""
+        if self.hw_encoder == 'h264_nvenc':
+            return ['-c:v', 'h264_nvenc', '-preset', 'p5', '-rc', 'vbr', '-cq', '23']
+        if self.hw_encoder == 'h264_qsv':
+            return ['-c:v', 'h264_qsv', '-global_quality', '23']
+        if self.hw_encoder == 'h264_videotoolbox':
+            return ['-c:v', 'h264_videotoolbox', '-q:v', '55']
+        # CPU fallback - veryfast is 5-8x faster than slow and the quality
+        # difference is invisible after YouTube re-encodes the Short anyway
+        preset = self.video_settings.get('x264_preset', 'veryfast')
+        return ['-c:v', 'libx264', '-preset', preset, '-crf', '23']
+
+    def _resolve_font(self, font_size: int):
+        """Load the overlay font, caching one instance per size"""
+        if font_size in self._fonts:
+            return self._fonts[font_size]
+
         font = None
-        
-        font_paths = [
-            "arialbd.ttf",
-            "arial.ttf",
-            "C:/Windows/Fonts/arialbd.ttf",
-            "C:/Windows/Fonts/arial.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-        ]
-        
-        for font_path in font_paths:
+        for font_path in self.FONT_PATHS:
             try:
                 font = ImageFont.truetype(font_path, font_size)
                 break
             except:
                 continue
-        
+
         if font is None:
             font = ImageFont.load_default()
-        
+
+        self._fonts[font_size] = font
+        return font
+
+    def _create_text_overlay(self, text: str, width: int, height: int = 200, part_number: int = 0) -> str:
+        """Create a text overlay image using PIL (cached on disk per text/size)"""
+        # The overlay only depends on text + dimensions + font size, so reuse
+        # a previously rendered PNG when one exists
+        font_size = self.overlay_settings.get('part_text_size', 80)
+        key = hashlib.sha1(f"{text}|{width}|{height}|{font_size}".encode()).hexdigest()
+        cached_path = os.path.join(self.overlay_cache_dir, f"{key}.png")
+
+        if os.path.exists(cached_path):
+            return cached_path
+
+        # Create transparent image
+        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+
+        font = self._resolve_font(font_size)
+
         # Get text dimensions
         try:
             bbox = draw.textbbox((0, 0), text, font=font)
@@ -95,42 +203,65 @@ class VideoEditor:
         x = (width - text_width) // 2
         y = 50 
         
-        # Draw STRONG shadow for visibility over video
-        shadow_offset = 4
-        for ox in [-shadow_offset, 0, shadow_offset]:
-            for oy in [-shadow_offset, 0, shadow_offset]:
-                if ox != 0 or oy != 0:
-                    draw.text((x + ox, y + oy), text, font=font, fill=(0, 0, 0, 255))
-        
-        # Draw main text
-        draw.text((x, y), text, font=font, fill=(255, 255, 255, 255))
-        
-        # Save to temp file
-        overlay_path = 'temp_overlay.png'
-        img.save(overlay_path)
+        # Rasterize the glyphs once onto an alpha mask, then dilate the mask
+        # for a STRONG shadow instead of redrawing the text at 8 offsets
+        mask = Image.new('L', (width, height), 0)
+        ImageDraw.Draw(mask).text((x, y), text, font=font, fill=255)
+        shadow = mask.filter(ImageFilter.MaxFilter(9))  # ~4px dilation
+
+        # Composite shadow first, then the white text on top
+        img.paste((0, 0, 0, 255), (0, 0), shadow)
+        img.paste((255, 255, 255, 255), (0, 0), mask)
         
-        return overlay_path
+        # Save atomically into the cache: write a unique temp file (no race
+        # between parallel editors), then rename into place
+        os.makedirs(self.overlay_cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            suffix='.png', prefix=f'overlay_p{part_number}_{os.getpid()}_',
+            dir=self.overlay_cache_dir
+        )
+        os.close(fd)
+        img.save(tmp_path)
+        os.replace(tmp_path, cached_path)
+
+        return cached_path
     
+    def _list_gameplay_files(self, folder: str) -> list:
+        """List gameplay videos, scanning the folder only once per editor lifetime"""
+        if self._gameplay_files is None:
+            with os.scandir(folder) as it:
+                self._gameplay_files = [
+                    e.path for e in it
+                    if e.is_file() and e.name.rpartition('.')[2].lower() in {'mp4', 'mkv', 'mov'}
+                ]
+        return self._gameplay_files
+
+    def _get_gameplay_duration(self, gameplay_path: str) -> float:
+        """Get a gameplay file's duration, probing each file at most once"""
+        key = (gameplay_path, os.path.getmtime(gameplay_path))
+        if key not in self._gameplay_durations:
+            self._gameplay_durations[key] = get_video_info(gameplay_path)['duration']
+        return self._gameplay_durations[key]
+
     def _get_random_gameplay(self, duration: float):
         """Find a gameplay video and get random start time"""
         folder = self.split_screen_config.get('gameplay_folder', 'assets/gameplay')
-        
+
         if not os.path.exists(folder):
             logger.warning(f"Gameplay folder not found: {folder}")
             return None, 0
-            
-        files = [os.path.join(folder, f) for f in os.listdir(folder) if f.endswith(('.mp4', '.mkv', '.mov'))]
-        
+
+        files = self._list_gameplay_files(folder)
+
         if not files:
             logger.warning("No gameplay videos found!")
             return None, 0
-            
+
         gameplay_path = random.choice(files)
-        
-        # Get its duration
-        gp_info = get_video_info(gameplay_path)
-        gp_duration = gp_info['duration']
-        
+
+        # Get its duration (cached after the first probe)
+        gp_duration = self._get_gameplay_duration(gameplay_path)
+
         if gp_duration <= duration:
             start_time = 0
         else:
@@ -141,6 +272,106 @@ class VideoEditor:
         logger.info(f"Selected gameplay: {gameplay_path} (Start: {start_time:.2f}s)")
         return gameplay_path, start_time
 
+    def _build_edit_cmd(self, video_path: str, part_number: int) -> list:
+        """
+        Build the FFmpeg command for one segment edit (Split Screen or Blur
+        Background), minus the output muxing args appended by the caller.
+        """
+        video_info = get_video_info(video_path)
+        input_width = video_info['width']
+        input_height = video_info['height']
+        duration = video_info['duration']
+
+        # Target resolution
+        target_width, target_height = self.video_settings.get('target_resolution', [1080, 1920])
+
+        # Header text: prefer FFmpeg's native drawtext (no temp PNG, one
+        # fused pass); fall back to the PIL overlay when no font file exists
+        part_text = self.overlay_settings.get('part_text_format', 'Part {n}').format(n=part_number)
+        use_drawtext = self._font_file is not None
+        overlay_path = None
+        if not use_drawtext:
+            overlay_path = self._create_text_overlay(part_text, target_width, part_number=part_number)
+
+        # CHECK SPLIT SCREEN
+        use_split_screen = self.split_screen_config.get('enabled', False)
+        gameplay_path = None
+        gameplay_start = 0
+
+        if use_split_screen:
+            gameplay_path, gameplay_start = self._get_random_gameplay(duration)
+            if not gameplay_path:
+                logger.warning("Falling back to blur background mode")
+                use_split_screen = False
+
+        # FAST PATH: input already matches the target geometry and no
+        # split screen, so scaling/blurring would be wasted work
+        fast_path = (
+            not use_split_screen
+            and input_width == target_width
+            and input_height == target_height
+        )
+        if fast_path:
+            logger.info("Input already at target resolution - overlay-only fast path")
+
+        # BUILD FFMPEG COMMAND
+        cmd = ['ffmpeg', '-y']
+
+        # Input 0: Main Video
+        cmd.extend(['-i', video_path])
+
+        # Input 1: Gameplay (if split screen)
+        if use_split_screen:
+            # Need to add gameplay file with seek
+            cmd.extend(['-ss', str(gameplay_start), '-t', str(duration), '-i', gameplay_path])
+
+            # Filter for Split Screen (ends at [base], text stage added below)
+            base_graph = self._build_filter_split_screen(target_width, target_height)
+            # Map audio from main video only (0:a)
+            map_args = ['-map', '[v_out]', '-map', '0:a']
+            out_label = 'v_out'
+        else:
+            if fast_path:
+                # No geometry change needed - text goes straight onto [0:v]
+                base_graph = None
+            else:
+                # Filter for Blur Background
+                base_graph = self._build_filter_with_blur_background(
+                    input_width, input_height, target_width, target_height
+                )
+            map_args = ['-map', '[outv]', '-map', '0:a?']
+            out_label = 'outv'
+
+        # Chain the header text onto the base graph
+        src = '[0:v]' if base_graph is None else '[base]'
+        prefix = '' if base_graph is None else base_graph + ';'
+
+        if use_drawtext:
+            filter_complex = f"{prefix}{src}{self._drawtext_filter(part_text)}[{out_label}]"
+        else:
+            # Last input: PIL overlay PNG
+            cmd.extend(['-i', overlay_path])
+            overlay_input = 2 if use_split_screen else 1
+            filter_complex = f"{prefix}{src}[{overlay_input}:v]overlay=(W-w)/2:0[{out_label}]"
+
+        encoder_args = self._encoder_args()
+        if fast_path and not self.hw_encoder:
+            # Overlay-only burn-in: spend as little CPU as possible
+            encoder_args = ['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '18']
+
+        # Common options (output muxing appended by the caller)
+        cmd.extend([
+            '-filter_complex', filter_complex,
+            *map_args,
+            *encoder_args,
+            '-c:a', 'aac',
+            '-b:a', '256k',
+            '-r', '30',
+            '-threads', str(self.video_settings.get('ffmpeg_threads', 2)),
+        ])
+
+        return cmd
+
     def add_overlays(self, video_path: str, part_number: int, title: str, output_path: str = None) -> str:
         """
         Add text overlays and convert to proper format (Split Screen or Blur Background)
@@ -148,88 +379,41 @@ class VideoEditor:
         if output_path is None:
             base, ext = os.path.splitext(video_path)
             output_path = f"{base}_edited{ext}"
-        
+
         try:
             logger.info(f"Processing video: {video_path}")
-            
+
             if not os.path.exists(video_path):
                 logger.error(f"Input file not found: {video_path}")
                 return None
-            
-            # Get main video info
-            video_info = get_video_info(video_path)
-            input_width = video_info['width']
-            input_height = video_info['height']
-            duration = video_info['duration']
-            
-            # Target resolution
-            target_width, target_height = self.video_settings.get('target_resolution', [1080, 1920])
-            
-            # Create text overlay
-            part_text = self.overlay_settings.get('part_text_format', 'Part {n}').format(n=part_number)
-            overlay_path = self._create_text_overlay(part_text, target_width)
-            
-            # CHECK SPLIT SCREEN
-            use_split_screen = self.split_screen_config.get('enabled', False)
-            gameplay_path = None
-            gameplay_start = 0
-            
-            if use_split_screen:
-                gameplay_path, gameplay_start = self._get_random_gameplay(duration)
-                if not gameplay_path:
-                    logger.warning("Falling back to blur background mode")
-                    use_split_screen = False
-            
-            # BUILD FFMPEG COMMAND
-            cmd = ['ffmpeg', '-y']
-            
-            # Input 0: Main Video
-            cmd.extend(['-i', video_path])
-            
-            # Input 1: Gameplay (if split screen) or Overlay (if blur)
-            if use_split_screen:
-                # Need to add gameplay file with seek
-                cmd.extend(['-ss', str(gameplay_start), '-t', str(duration), '-i', gameplay_path])
-                # Input 2: Overlay
-                cmd.extend(['-i', overlay_path])
-                
-                # Filter for Split Screen
-                filter_complex = self._build_filter_split_screen(target_width, target_height)
-                # Map audio from main video only (0:a)
-                map_args = ['-map', '[v_out]', '-map', '0:a']
-                
-            else:
-                # Input 1: Overlay
-                cmd.extend(['-i', overlay_path])
-                
-                # Filter for Blur Background
-                filter_complex = self._build_filter_with_blur_background(
-                    input_width, input_height, target_width, target_height
-                )
-                map_args = ['-map', '[outv]', '-map', '0:a?']
 
-            # Common options
+            cmd = self._build_edit_cmd(video_path, part_number)
             cmd.extend([
-                '-filter_complex', filter_complex,
-                *map_args,
-                '-c:v', 'libx264',
-                '-preset', 'slow',
-                '-crf', '23',
-                '-c:a', 'aac',
-                '-b:a', '256k',
-                '-r', '30',
                 '-movflags', '+faststart',
                 '-loglevel', 'error',
                 output_path
             ])
-            
+
             logger.info(f"Running FFmpeg...")
             result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            # Cleanup temp overlay
-            if os.path.exists(overlay_path):
-                os.remove(overlay_path)
-            
+
+            if result.returncode != 0 and self.hw_encoder:
+                # The probe can pass and the real encode still fail (driver
+                # gone, GPU busy); drop to CPU for this and later segments
+                logger.warning(
+                    f"{self.hw_encoder} encode failed, retrying with libx264: {result.stderr}"
+                )
+                self.hw_encoder = ''
+                cmd = self._build_edit_cmd(video_path, part_number)
+                cmd.extend([
+                    '-movflags', '+faststart',
+                    '-loglevel', 'error',
+                    output_path
+                ])
+                result = subprocess.run(cmd, capture_output=True, text=True)
+
+            # Overlay PNG stays in overlays_cache for reuse by later parts
+
             if result.returncode != 0:
                 logger.error(f"FFmpeg error: {result.stderr}")
                 return None
@@ -246,13 +430,41 @@ class VideoEditor:
             import traceback
             traceback.print_exc()
             return None
-    
+
+    def open_edit_stream(self, video_path: str, part_number: int):
+        """
+        Run the same edit as add_overlays but emit a fragmented MP4 on
+        stdout instead of writing *_edited.mp4, so the caller can feed the
+        bytes straight into an upload. Returns a subprocess.Popen or None.
+        """
+        try:
+            if not os.path.exists(video_path):
+                logger.error(f"Input file not found: {video_path}")
+                return None
+
+            cmd = self._build_edit_cmd(video_path, part_number)
+            cmd.extend([
+                # Fragmented MP4: playable/uploadable without seeking back
+                # to rewrite the moov atom
+                '-movflags', 'frag_keyframe+empty_moov',
+                '-f', 'mp4',
+                '-loglevel', 'error',
+                'pipe:1'
+            ])
+
+            logger.info(f"Running FFmpeg (streaming to stdout)...")
+            return subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=1 << 20)
+
+        except Exception as e:
+            logger.error(f"Error starting streaming edit: {e}")
+            return None
+
     def _build_filter_split_screen(self, out_w: int, out_h: int) -> str:
         """
         Builds filter for:
         Top: Main Video (60% height)
         Bottom: Gameplay (40% height)
-        Text Overlay: Directly on top of video with shadow
+        Output label [base] - the text stage is chained on by the caller
         """
         available_h = out_h # Full screen used
         
@@ -264,52 +476,49 @@ class VideoEditor:
             
         bottom_h = available_h - top_h
         
-        # [0:v] is main, [1:v] is gameplay, [2:v] is overlay
-        
+        # [0:v] is main, [1:v] is gameplay
+
         filter_complex = (
             # 1. Scale and Crop Main Video (Top) - WITH HORIZONTAL FLIP
             f"[0:v]hflip,scale={out_w}:{top_h}:force_original_aspect_ratio=increase,"
             f"crop={out_w}:{top_h}[top];"
-            
+
             # 2. Scale and Crop Gameplay (Bottom)
             f"[1:v]scale={out_w}:{bottom_h}:force_original_aspect_ratio=increase,"
             f"crop={out_w}:{bottom_h}[bottom];"
-            
-            # 3. Stack them (Total height = out_h)
-            f"[top][bottom]vstack[stacked];"
-            
-            # 4. Add Overlay (Text directly on video)
-            f"[stacked][2:v]overlay=(W-w)/2:0[v_out]"
+
+            # 3. Stack them in a single xstack node (Total height = out_h)
+            f"[top][bottom]xstack=inputs=2:layout=0_0|0_h0[base]"
         )
         return filter_complex
 
     def _build_filter_with_blur_background(self, in_w: int, in_h: int, out_w: int, out_h: int) -> str:
-        """Fallback filter for blur background mode"""
+        """Fallback filter for blur background mode (ends at [base])"""
         target_aspect = out_w / out_h
         current_aspect = in_w / in_h
-        
+
         if current_aspect > target_aspect:
             filter_complex = (
+                # Blur at quarter resolution: 16x fewer pixels to blur, and the
+                # result is visually identical once upscaled to full size
                 "[0:v]split=2[bg_in][fg_in];"
-                f"[bg_in]scale={out_w}:{out_h}:force_original_aspect_ratio=increase,"
-                f"crop={out_w}:{out_h},"
-                "gblur=sigma=18,"
+                f"[bg_in]scale={out_w // 4}:{out_h // 4}:force_original_aspect_ratio=increase,"
+                f"crop={out_w // 4}:{out_h // 4},"
+                "boxblur=luma_radius=8:luma_power=3:chroma_radius=4:chroma_power=3,"
+                f"scale={out_w}:{out_h},"
                 "eq=brightness=-0.3:saturation=0.5"
                 "[bg];"
                 f"[fg_in]scale={out_w}:-2[fg_scaled];"
-                "[bg][fg_scaled]overlay=(W-w)/2:(H-h)/2[video_out];"
-                "[video_out][1:v]overlay=(W-w)/2:0[outv]"
+                "[bg][fg_scaled]overlay=(W-w)/2:(H-h)/2[base]"
             )
         else:
             if current_aspect < target_aspect:
                 filter_complex = (
-                    f"[0:v]scale={out_w}:-2,crop={out_w}:{out_h}[scaled];"
-                    "[scaled][1:v]overlay=(W-w)/2:0[outv]"
+                    f"[0:v]scale={out_w}:-2,crop={out_w}:{out_h}[base]"
                 )
             else:
                 filter_complex = (
-                    f"[0:v]scale={out_w}:{out_h}[scaled];"
-                    "[scaled][1:v]overlay=(W-w)/2:0[outv]"
+                    f"[0:v]scale={out_w}:{out_h}[base]"
                 )
         return filter_complex
 
@@ -3,116 +3,442 @@ YouTube Channel Scraper
 Scrapes all videos from a YouTube channel without using API
 """
 import requests
-from bs4 import BeautifulSoup
+import hashlib
 import json
+import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson decodes the multi-MB ytInitialData blob several times faster than
+# stdlib json; fall back silently when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-def get_channel_videos(channel_url: str, sort_by: str = 'date') -> List[Dict]:
+# One pooled session shared by every scrape call: TCP+TLS handshakes are
+# reused across requests and responses arrive gzip-compressed. Pool is
+# sized to cover scrape_many's concurrent workers.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate',
+})
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=32))
+
+# On-disk cache of parsed video lists, validated with ETags: when the
+# channel page hasn't changed YouTube answers 304 and we skip the
+# multi-MB download and re-parse entirely
+_CACHE_DIR = '.scrape_cache'
+
+
+def _cache_path(channel_url: str) -> str:
+    return os.path.join(_CACHE_DIR, hashlib.sha1(channel_url.encode()).hexdigest() + '.json')
+
+
+def _cache_read(channel_url: str):
+    try:
+        with open(_cache_path(channel_url), 'rb') as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_write(channel_url: str, etag: str, videos: List[Dict]):
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    # Atomic write so a crash mid-save never leaves a truncated cache entry
+    fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'etag': etag, 'videos': videos}, f, ensure_ascii=False)
+        os.replace(tmp_path, _cache_path(channel_url))
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+_YTDATA_MARKER = 'var ytInitialData = '
+_YTDATA_MARKER_B = _YTDATA_MARKER.encode()
+
+# Continuation pages are fetched from the same endpoint the YouTube
+# frontend uses; responses are bare JSON (~30 videos each) with none of
+# the HTML wrapper, so paging is far cheaper than the initial scrape
+_INNERTUBE_KEY_RE = re.compile(r'"INNERTUBE_API_KEY":"([^"]+)"')
+_BROWSE_URL = 'https://www.youtube.com/youtubei/v1/browse?key={key}'
+_INNERTUBE_CONTEXT = {'client': {'clientName': 'WEB', 'clientVersion': '2.20240101.00.00'}}
+
+# Compiled once at import; parse_view_count runs for every video on a page
+_VIEW_RE = re.compile(r'([\d.,]+)\s*([kmbKMB]?)')
+# Case-folded by key duplication so the lookup needs no .lower() allocation
+_MULT = {
+    '': 1,
+    'k': 1000, 'm': 1000000, 'b': 1000000000,
+    'K': 1000, 'M': 1000000, 'B': 1000000000,
+}
+
+
+# Only these four characters affect brace depth or string state; letting
+# the regex engine jump between them keeps the scan at C speed instead of
+# interpreting a per-character Python loop over multi-MB input
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+_JSON_TOKEN_RE_B = re.compile(rb'[{}"\\]')
+
+
+def _find_json_end(text: str, start: int) -> int:
+    """
+    Walk text from the opening '{' at `start`, tracking brace depth and
+    string/escape state, and return the index just past the matching '}'.
+    Returns -1 if the object never closes.
+    """
+    depth = 0
+    in_str = False
+    skip = -1  # index of a character escaped by the previous backslash
+
+    for m in _JSON_TOKEN_RE.finditer(text, start):
+        i = m.start()
+        if i == skip:
+            continue
+        ch = m.group()
+        if in_str:
+            if ch == '\\':
+                skip = i + 1
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+
+    return -1
+
+
+def _stream_ytdata_html(response) -> str:
+    """
+    Read the response body in chunks and stop as soon as the ytInitialData
+    object closes. The page tail (hundreds of KB of markup and scripts past
+    the JSON blob) is never downloaded, and only one buffer is held instead
+    of the full page plus slices. Scans bytes directly: the structural
+    characters are ASCII, so UTF-8 continuation bytes can't collide.
+    """
+    buf = bytearray()
+    pos = 0
+    json_start = -1
+    depth = 0
+    in_str = False
+    skip = -1  # absolute index of a byte escaped by the previous backslash
+
+    for chunk in response.iter_content(65536):
+        prev_len = len(buf)
+        buf += chunk
+
+        if json_start == -1:
+            # Re-check a marker-sized overlap in case it straddled chunks
+            marker = buf.find(_YTDATA_MARKER_B, max(0, prev_len - len(_YTDATA_MARKER_B)))
+            if marker == -1:
+                continue
+            json_start = buf.find(b'{', marker)
+            if json_start == -1:
+                continue
+            pos = json_start
+
+        for m in _JSON_TOKEN_RE_B.finditer(buf, pos):
+            i = m.start()
+            if i == skip:
+                continue
+            b = buf[i]
+            if in_str:
+                if b == 0x5C:  # backslash
+                    skip = i + 1
+                elif b == 0x22:  # quote
+                    in_str = False
+            elif b == 0x22:
+                in_str = True
+            elif b == 0x7B:  # {
+                depth += 1
+            elif b == 0x7D:  # }
+                depth -= 1
+                if depth == 0:
+                    response.close()
+                    return bytes(buf[:i + 1]).decode('utf-8', errors='replace')
+        pos = len(buf)
+
+    response.close()
+    return bytes(buf).decode('utf-8', errors='replace')
+
+
+def get_channel_videos(channel_url: str, sort_by: str = 'date', refresh: bool = False,
+                       max_pages: int = 0) -> List[Dict]:
     """
     Scrape all videos from a YouTube channel and sort
-    
+
     Args:
         channel_url: YouTube channel URL (e.g., https://www.youtube.com/@ChannelName)
         sort_by: 'date' for newest first, 'views' for highest views first
-    
+        refresh: skip the on-disk ETag cache and always re-download
+        max_pages: extra continuation pages to fetch beyond the ~30 videos
+                   embedded in the initial HTML (0 = first page only)
+
     Returns:
         List of video dictionaries with id, title, views, duration, upload_date
     """
-    logger.info(f"Scraping channel: {channel_url}")
-    
+    logger.info("Scraping channel: %s", channel_url)
+
     # Ensure URL ends with /videos
     if not channel_url.endswith('/videos'):
         channel_url = channel_url.rstrip('/') + '/videos'
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
-    
+
+    cached = None if refresh else _cache_read(channel_url)
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+
     try:
-        response = requests.get(channel_url, headers=headers)
-        response.raise_for_status()
-        
-        # Extract initial data from page
-        videos = extract_videos_from_page(response.text)
-        
-        logger.info(f"Found {len(videos)} videos")
-        
-        # Sort by date (newest first) or views (highest first)
+        response = _SESSION.get(channel_url, headers=headers, timeout=15, stream=True)
+
+        if response.status_code == 304 and cached:
+            response.close()
+            videos = cached['videos']
+            logger.info("Channel unchanged, using cached list (%d videos)", len(videos))
+            if sort_by != 'date':
+                videos.sort(key=lambda x: x.get('views', 0), reverse=True)
+        else:
+            response.raise_for_status()
+
+            # Extract initial data from page (streamed only up to the end
+            # of the ytInitialData blob)
+            html = _stream_ytdata_html(response)
+            batch = _extract_batch(html)
+
+            if max_pages and batch.continuation:
+                # The API key sits in ytcfg, which precedes ytInitialData,
+                # so the streamed prefix always contains it
+                key_match = _INNERTUBE_KEY_RE.search(html)
+                if key_match:
+                    _fetch_continuations(batch, key_match.group(1), max_pages)
+
+            videos = batch.as_dicts()
+            # Cache in natural (newest-first) order regardless of sort_by
+            _cache_write(channel_url, response.headers.get('ETag'), videos)
+
+            logger.info("Found %d videos", len(videos))
+
+            if sort_by != 'date':
+                # Index sort over the flat views column, then rebuild
+                batch.sort_by_views()
+                videos = batch.as_dicts()
+
+        # Videos arrive in chronological order (newest first) from YouTube
         if sort_by == 'date':
-            # Videos are already in chronological order (newest first) from YouTube
             logger.info("Sorted by upload date (newest first)")
         else:
-            # Sort by views (highest first)
-            videos.sort(key=lambda x: x.get('views', 0), reverse=True)
             logger.info("Sorted by views (highest first)")
-        
+
         return videos
         
     except Exception as e:
-        logger.error(f"Error scraping channel: {e}")
+        logger.error("Error scraping channel: %s", e)
         return []
 
 
-def extract_videos_from_page(html_content: str) -> List[Dict]:
+def scrape_many(channel_urls: List[str], sort_by: str = 'date', max_workers: int = 8) -> Dict[str, List[Dict]]:
     """
-    Extract video information from YouTube page HTML
+    Scrape several channels concurrently.
+
+    Scraping is network-bound, so a thread pool gives near-linear speedup
+    over calling get_channel_videos in a loop.
+
+    Args:
+        channel_urls: List of YouTube channel URLs
+        sort_by: passed through to get_channel_videos
+        max_workers: Maximum concurrent requests
+
+    Returns:
+        Dict mapping each channel URL to its video list (empty on failure)
     """
-    videos = []
-    
-    # Look for ytInitialData JSON in the page
-    match = re.search(r'var ytInitialData = ({.*?});', html_content)
-    if not match:
+    if not channel_urls:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(channel_urls))) as pool:
+        futures = {pool.submit(get_channel_videos, url, sort_by): url for url in channel_urls}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return results
+
+
+class VideoBatch:
+    """
+    Struct-of-arrays holder for scraped videos: one flat list per column
+    instead of one dict per video. Column operations (sorting by views)
+    touch a single int list rather than calling into every dict, and the
+    per-video dicts are only materialized on demand via as_dicts().
+    """
+    _COLUMNS = ('ids', 'titles', 'views', 'durations', 'published')
+    __slots__ = _COLUMNS + ('continuation',)
+
+    def __init__(self):
+        self.ids = []
+        self.titles = []
+        self.views = []
+        self.durations = []
+        self.published = []
+        self.continuation = None  # token for the next page, if any
+
+    def __len__(self):
+        return len(self.ids)
+
+    def sort_by_views(self):
+        """Reorder all columns by descending view count"""
+        order = sorted(range(len(self.views)), key=self.views.__getitem__, reverse=True)
+        for name in self._COLUMNS:
+            col = getattr(self, name)
+            setattr(self, name, [col[i] for i in order])
+
+    def as_dicts(self) -> List[Dict]:
+        """Materialize the list-of-dicts shape the rest of the pipeline uses"""
+        return [
+            {
+                'id': vid,
+                'title': title,
+                'views': views,
+                'duration': duration,
+                'published': published,
+                'url': f'https://www.youtube.com/watch?v={vid}'
+            }
+            for vid, title, views, duration, published
+            in zip(self.ids, self.titles, self.views, self.durations, self.published)
+        ]
+
+
+def _extract_items(contents: list, batch: VideoBatch):
+    """
+    Append the videoRenderer items in `contents` to `batch`, capturing any
+    continuation token for the next page. Shared by the initial HTML parse
+    and the JSON-only continuation pages.
+    """
+    # Hot loop: direct indexing with one try/except per video is much
+    # cheaper than chained .get() calls allocating default dicts on
+    # every hop; .get stays only on optional fields
+    _ids = batch.ids.append
+    _titles = batch.titles.append
+    _views = batch.views.append
+    _durations = batch.durations.append
+    _published = batch.published.append
+    _parse = parse_view_count
+
+    for item in contents:
+        try:
+            video_renderer = item['richItemRenderer']['content']['videoRenderer']
+            video_id = video_renderer['videoId']
+            title = video_renderer['title']['runs'][0]['text']
+        except (KeyError, IndexError, TypeError):
+            # The grid's trailing item carries the next-page token
+            try:
+                batch.continuation = item['continuationItemRenderer']['continuationEndpoint']['continuationCommand']['token']
+            except (KeyError, TypeError):
+                pass
+            continue
+
+        view_text = video_renderer.get('viewCountText', {}).get('simpleText', '0')
+        duration_text = video_renderer.get('lengthText', {}).get('simpleText', '')
+        publish_time = video_renderer.get('publishedTimeText', {}).get('simpleText', 'Unknown')
+
+        _ids(video_id)
+        _titles(title)
+        _views(_parse(view_text))
+        _durations(duration_text)
+        _published(publish_time)
+
+
+def _fetch_continuations(batch: VideoBatch, api_key: str, max_pages: int):
+    """
+    Follow continuation tokens for up to max_pages extra pages, appending
+    each batch of ~30 videos to `batch`
+    """
+    pages = 0
+    while batch.continuation and pages < max_pages:
+        token = batch.continuation
+        batch.continuation = None
+
+        try:
+            response = _SESSION.post(
+                _BROWSE_URL.format(key=api_key),
+                json={'context': _INNERTUBE_CONTEXT, 'continuation': token},
+                timeout=15
+            )
+            response.raise_for_status()
+            data = _json_loads(response.content)
+        except Exception as e:
+            # A failed extra page degrades the result, it must not erase
+            # the videos already collected from earlier pages
+            logger.warning("Continuation page %d failed, keeping %d videos: %s",
+                           pages + 1, len(batch), e)
+            break
+
+        for action in data.get('onResponseReceivedActions', []):
+            items = action.get('appendContinuationItemsAction', {}).get('continuationItems', [])
+            _extract_items(items, batch)
+
+        pages += 1
+
+
+def _extract_batch(html_content: str) -> VideoBatch:
+    """
+    Extract video information from YouTube page HTML into a VideoBatch
+    """
+    batch = VideoBatch()
+
+    # Look for ytInitialData JSON in the page. A linear brace-depth scan is
+    # used instead of a regex: '};' can legitimately appear inside JSON
+    # strings, and a lazy '.*?' backtracks over the whole multi-MB document.
+    marker = html_content.find(_YTDATA_MARKER)
+    if marker == -1:
         logger.warning("Could not find ytInitialData in page")
-        return videos
-    
+        return batch
+
+    json_start = html_content.find('{', marker)
+    json_end = _find_json_end(html_content, json_start) if json_start != -1 else -1
+    if json_end == -1:
+        logger.warning("Could not find ytInitialData in page")
+        return batch
+
     try:
-        data = json.loads(match.group(1))
-        
+        data = _json_loads(html_content[json_start:json_end])
+
         # Navigate through the nested JSON structure
         tabs = data.get('contents', {}).get('twoColumnBrowseResultsRenderer', {}).get('tabs', [])
-        
+
         for tab in tabs:
-            tab_renderer = tab.get('tabRenderer', {})
-            if tab_renderer.get('selected'):
-                contents = tab_renderer.get('content', {}).get('richGridRenderer', {}).get('contents', [])
-                
-                for item in contents:
-                    video_renderer = item.get('richItemRenderer', {}).get('content', {}).get('videoRenderer', {})
-                    
-                    if video_renderer:
-                        video_id = video_renderer.get('videoId')
-                        title = video_renderer.get('title', {}).get('runs', [{}])[0].get('text', '')
-                        
-                        # Extract view count
-                        view_text = video_renderer.get('viewCountText', {}).get('simpleText', '0')
-                        views = parse_view_count(view_text)
-                        
-                        # Extract duration
-                        duration_text = video_renderer.get('lengthText', {}).get('simpleText', '')
-                        
-                        # Extract upload time (e.g., "2 days ago", "1 week ago")
-                        publish_time = video_renderer.get('publishedTimeText', {}).get('simpleText', 'Unknown')
-                        
-                        if video_id and title:
-                            videos.append({
-                                'id': video_id,
-                                'title': title,
-                                'views': views,
-                                'duration': duration_text,
-                                'published': publish_time,
-                                'url': f'https://www.youtube.com/watch?v={video_id}'
-                            })
-        
+            # Bail before touching content: only one of the ~7 tabs
+            # (Home/Videos/Shorts/...) is selected
+            tab_renderer = tab.get('tabRenderer')
+            if not tab_renderer or not tab_renderer.get('selected'):
+                continue
+            contents = tab_renderer.get('content', {}).get('richGridRenderer', {}).get('contents', [])
+            _extract_items(contents, batch)
+
     except Exception as e:
-        logger.error(f"Error parsing video data: {e}")
-    
-    return videos
+        logger.error("Error parsing video data: %s", e)
+
+    return batch
+
+
+def extract_videos_from_page(html_content: str) -> List[Dict]:
+    """
+    Extract video information from YouTube page HTML
+    """
+    return _extract_batch(html_content).as_dicts()
 
 
 def parse_view_count(view_text: str) -> int:
@@ -120,20 +446,13 @@ def parse_view_count(view_text: str) -> int:
     Parse view count text like "1.2M views" to integer
     """
     try:
-        # Remove "views" and clean
-        view_text = view_text.lower().replace('views', '').replace('view', '').strip()
-        
-        # Handle K, M, B suffixes
-        multipliers = {'k': 1000, 'm': 1000000, 'b': 1000000000}
-        
-        for suffix, multiplier in multipliers.items():
-            if suffix in view_text:
-                number = float(view_text.replace(suffix, '').strip())
-                return int(number * multiplier)
-        
-        # No suffix, just a number
-        return int(view_text.replace(',', ''))
-        
+        m = _VIEW_RE.search(view_text)
+        if not m:
+            return 0
+
+        number = float(m.group(1).replace(',', ''))
+        return int(number * _MULT[m.group(2)])
+
     except:
         return 0
 
@@ -4,16 +4,28 @@ Uploads videos to Instagram Reels using instagrapi
 """
 from instagrapi import Client
 from instagrapi.exceptions import LoginRequired
+import asyncio
+import hashlib
 import os
 import logging
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _sha256_file(video_path: str) -> str:
+    """Digest a file; file_digest (3.11+) hashes at C speed without a Python read loop"""
+    with open(video_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+        return h.hexdigest()
+
+
 class InstagramUploader:
     def __init__(self, username: str, password: str):
         self.username = username
@@ -27,21 +39,23 @@ class InstagramUploader:
         Login to Instagram with session caching
         """
         try:
-            # Try to load existing session
+            # Try to load existing session; only fall back to a full
+            # username/password login when the cached session is rejected
             if os.path.exists(self.session_file):
                 logger.info("Loading existing session...")
                 self.client.load_settings(self.session_file)
-                self.client.login(self.username, self.password)
-                
+
                 try:
-                    self.client.get_timeline_feed()
+                    # account_info is a single lightweight request, much
+                    # cheaper than pulling a full timeline feed as a probe
+                    self.client.account_info()
                     logger.info("✓ Session valid, logged in successfully")
                     return True
                 except LoginRequired:
                     logger.info("Session expired, logging in again...")
             
             # Fresh login
-            logger.info(f"Logging in as {self.username}...")
+            logger.info("Logging in as %s...", self.username)
             self.client.login(self.username, self.password)
             
             # Save session
@@ -50,7 +64,7 @@ class InstagramUploader:
             return True
             
         except Exception as e:
-            logger.error(f"Login failed: {e}")
+            logger.error("Login failed: %s", e)
             return False
     
     def upload_reel(self, video_path: str, caption: str, delay_minutes: int = 0) -> bool:
@@ -66,38 +80,68 @@ class InstagramUploader:
             True if upload successful, False otherwise
         """
         if not os.path.exists(video_path):
-            logger.error(f"Video file not found: {video_path}")
+            logger.error("Video file not found: %s", video_path)
             return False
         
-        # Rate limiting - wait if needed
-        if delay_minutes > 0 and self.last_upload_time:
-            time_since_last = datetime.now() - self.last_upload_time
-            wait_time = timedelta(minutes=delay_minutes) - time_since_last
-            
-            if wait_time.total_seconds() > 0:
-                logger.info(f"Waiting {wait_time.total_seconds():.0f}s before next upload...")
-                time.sleep(wait_time.total_seconds())
+        # Rate limiting - wait if needed. Monotonic clock: wall-clock
+        # jumps (NTP resync, DST) can't shorten or stretch the wait
+        if delay_minutes > 0 and self.last_upload_time is not None:
+            elapsed = time.monotonic() - self.last_upload_time
+            wait = delay_minutes * 60 - elapsed
+
+            if wait > 0:
+                logger.info("Waiting %.0fs before next upload...", wait)
+                time.sleep(wait)
         
         try:
-            logger.info(f"Uploading reel: {video_path}")
-            logger.info(f"Caption: {caption}")
+            logger.info("Uploading reel: %s", video_path)
+            logger.info("Caption: %s", caption)
             
+            # Start the rate-limit clock before the upload, not after: a
+            # multi-minute upload already counts toward the spacing, so
+            # consecutive reels are spaced max(delay, upload_time) apart
+            # instead of upload_time + delay
+            upload_started = time.monotonic()
+
             # Upload as clip (Reel)
             media = self.client.clip_upload(
                 video_path,
                 caption=caption
             )
-            
-            self.last_upload_time = datetime.now()
-            logger.info(f"✓ Reel uploaded successfully! Media ID: {media.pk}")
-            logger.info(f"  URL: https://www.instagram.com/reel/{media.code}/")
+
+            self.last_upload_time = upload_started
+            logger.info("✓ Reel uploaded successfully! Media ID: %s", media.pk)
+            logger.info("  URL: https://www.instagram.com/reel/%s/", media.code)
             
             return True
             
         except Exception as e:
-            logger.error(f"Upload failed: {e}")
+            logger.error("Upload failed: %s", e)
             return False
     
+    async def upload_reel_async(self, video_path: str, caption: str, delay_minutes: int = 0) -> bool:
+        """
+        Upload a reel without blocking the event loop
+
+        The video is checksummed on a background thread while the upload
+        itself runs, so the extra disk pass overlaps with the network
+        transfer instead of adding to it.
+
+        Returns:
+            True if upload successful, False otherwise
+        """
+        hash_task = asyncio.create_task(asyncio.to_thread(_sha256_file, video_path))
+
+        success = await asyncio.to_thread(self.upload_reel, video_path, caption, delay_minutes)
+
+        try:
+            digest = await hash_task
+            logger.info("Video sha256: %s", digest)
+        except OSError:
+            pass
+
+        return success
+
     def upload_multiple(self, video_files: list, caption_template: str, delay_minutes: int = 30) -> dict:
         """
         Upload multiple reels with delay between uploads
@@ -132,13 +176,44 @@ class InstagramUploader:
             else:
                 results['failed'].append(video_path)
         
-        logger.info(f"\n=== Upload Summary ===")
-        logger.info(f"Successful: {len(results['successful'])}")
-        logger.info(f"Failed: {len(results['failed'])}")
+        logger.info("\n=== Upload Summary ===")
+        logger.info("Successful: %d", len(results['successful']))
+        logger.info("Failed: %d", len(results['failed']))
         
         return results
 
 
+def upload_across_accounts(jobs: list, caption_template: str, delay_minutes: int = 30) -> dict:
+    """
+    Run upload_multiple for several accounts in parallel
+
+    Each account still uploads sequentially (Instagram rejects concurrent
+    uploads on one account), but independent accounts no longer wait on
+    each other's rate-limit delays.
+
+    Args:
+        jobs: List of (InstagramUploader, video_files) pairs
+        caption_template: Passed through to upload_multiple
+        delay_minutes: Per-account delay between uploads
+
+    Returns:
+        Dictionary mapping username to that account's upload results
+    """
+    if not jobs:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {
+            pool.submit(uploader.upload_multiple, video_files, caption_template, delay_minutes): uploader.username
+            for uploader, video_files in jobs
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return results
+
+
 if __name__ == "__main__":
     # Test uploader (requires valid credentials)
     print("⚠️  This is a test mode - please use with caution")
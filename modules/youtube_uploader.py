@@ -5,9 +5,13 @@ Automatic video upload to YouTube using official API
 import os
 import pickle
 import logging
+import threading
 from typing import Optional
+import google_auth_httplib2
+import httplib2
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 
@@ -23,6 +27,8 @@ class YouTubeUploader:
         self.credentials_file = credentials_file
         self.token_file = 'youtube_token.pickle'
         self.youtube = None
+        self._creds = None
+        self._local = threading.local()
         self._authenticate()
     
     def _authenticate(self):
@@ -62,33 +68,54 @@ class YouTubeUploader:
             logger.info("✓ Credentials saved")
         
         # Build YouTube service
+        self._creds = creds
         self.youtube = build('youtube', 'v3', credentials=creds)
         logger.info("✓ YouTube API authenticated successfully")
+
+    def _service(self):
+        """
+        Per-thread YouTube service.
+
+        httplib2 is not thread-safe: concurrent next_chunk() calls through
+        one shared AuthorizedHttp interleave reads on the same socket. Each
+        worker thread therefore gets its own service with its own transport.
+        """
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = build(
+                'youtube', 'v3',
+                http=google_auth_httplib2.AuthorizedHttp(self._creds, http=httplib2.Http())
+            )
+            self._local.service = service
+        return service
     
     def upload_short(
         self,
-        video_path: str,
-        title: str,
+        video_path: str = None,
+        title: str = '',
         description: str = '',
         tags: list = None,
         category_id: str = '22',  # 22 = People & Blogs
-        privacy_status: str = 'public'  # public, private, unlisted
+        privacy_status: str = 'public',  # public, private, unlisted
+        video_stream=None
     ) -> Optional[str]:
         """
         Upload video to YouTube Shorts
-        
+
         Args:
-            video_path: Path to video file
+            video_path: Path to video file (ignored if video_stream is given)
             title: Video title (max 100 chars)
             description: Video description
             tags: List of tags
             category_id: YouTube category ID
             privacy_status: public, private, or unlisted
-        
+            video_stream: Seekable file-like object with MP4 bytes, uploaded
+                          directly without a file on disk
+
         Returns:
             Video ID if successful, None otherwise
         """
-        if not os.path.exists(video_path):
+        if video_stream is None and not os.path.exists(video_path or ''):
             logger.error(f"Video file not found: {video_path}")
             return None
         
@@ -115,20 +142,28 @@ class YouTubeUploader:
             }
         }
         
-        # Media file
-        media = MediaFileUpload(
-            video_path,
-            mimetype='video/*',
-            resumable=True,
-            chunksize=1024*1024  # 1MB chunks
-        )
-        
+        # Media source: in-memory stream or file on disk
+        if video_stream is not None:
+            media = MediaIoBaseUpload(
+                video_stream,
+                mimetype='video/mp4',
+                resumable=True,
+                chunksize=8*1024*1024  # 8MB chunks
+            )
+        else:
+            media = MediaFileUpload(
+                video_path,
+                mimetype='video/*',
+                resumable=True,
+                chunksize=1024*1024  # 1MB chunks
+            )
+
         try:
             logger.info(f"Uploading to YouTube: {title}")
-            logger.info(f"File: {video_path}")
+            logger.info(f"File: {video_path or '<in-memory stream>'}")
             
-            # Execute upload
-            request = self.youtube.videos().insert(
+            # Execute upload on this thread's own service/transport
+            request = self._service().videos().insert(
                 part=','.join(body.keys()),
                 body=body,
                 media_body=media
@@ -149,7 +184,11 @@ class YouTubeUploader:
             logger.info(f"  URL: {video_url}")
             
             return video_id
-            
+
+        except HttpError:
+            # Surface API errors so callers can tell transient 5xx/429
+            # (worth retrying) apart from quota exhaustion (not worth it)
+            raise
         except Exception as e:
             logger.error(f"Upload failed: {e}")
             return None
@@ -188,12 +227,16 @@ class YouTubeUploader:
             description = description_template.format(title=video_title, part=part_num)
             
             # Upload
-            video_id = self.upload_short(
-                video_path=video_path,
-                title=title,
-                description=description,
-                tags=tags
-            )
+            try:
+                video_id = self.upload_short(
+                    video_path=video_path,
+                    title=title,
+                    description=description,
+                    tags=tags
+                )
+            except HttpError as e:
+                logger.error(f"Upload failed: {e}")
+                video_id = None
             
             if video_id:
                 results['successful'].append({
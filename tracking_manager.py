@@ -6,22 +6,20 @@ import json
 from datetime import datetime
 from typing import Dict, List
 
+from tracking_store import TrackingStore
+
 
 class TrackingManager:
-    def __init__(self, tracking_file='tracking.json'):
+    def __init__(self, tracking_file='tracking.sqlite'):
         self.tracking_file = tracking_file
+        self.store = TrackingStore(tracking_file)
         self.tracking = self._load()
-    
+
     def _load(self) -> dict:
-        try:
-            with open(self.tracking_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {'channel_url': '', 'last_scrape': None, 'videos': {}}
-    
-    def _save(self):
-        with open(self.tracking_file, 'w', encoding='utf-8') as f:
-            json.dump(self.tracking, f, indent=2, ensure_ascii=False)
+        return self.store.load()
+
+    def _save(self, video_id: str = None):
+        self.store.save(self.tracking, video_id)
     
     def get_stats(self) -> dict:
         """Get overall statistics"""
@@ -78,14 +76,14 @@ class TrackingManager:
             self.tracking['videos'][video_id]['status'] = 'completed'
             self.tracking['videos'][video_id]['parts_uploaded'] = parts
             self.tracking['videos'][video_id]['last_upload'] = datetime.now().isoformat()
-            self._save()
+            self._save(video_id)
     
     def reset_video_status(self, video_id: str):
         """Reset video to pending (to re-upload)"""
         if video_id in self.tracking.get('videos', {}):
             self.tracking['videos'][video_id]['status'] = 'pending'
             self.tracking['videos'][video_id]['parts_uploaded'] = []
-            self._save()
+            self._save(video_id)
     
     def export_uploaded_list(self, filename='uploaded_videos.txt'):
         """Export list of uploaded videos to text file"""
@@ -0,0 +1,104 @@
+"""
+SQLite Tracking Store
+Persists the tracking database with per-video row updates (WAL mode)
+instead of rewriting the whole JSON file on every change
+"""
+import json
+import logging
+import os
+import sqlite3
+import time
+
+logger = logging.getLogger(__name__)
+
+# orjson is 5-10x faster than stdlib json on dict payloads; fall back
+# silently when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    _loads = json.loads
+
+
+class TrackingStore:
+    def __init__(self, db_path: str = 'tracking.sqlite', legacy_json_path: str = 'tracking.json'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)'
+        )
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS videos ('
+            'id TEXT PRIMARY KEY, data TEXT, status TEXT, updated_at INTEGER)'
+        )
+        self.conn.commit()
+        self._migrate_legacy_json(legacy_json_path)
+
+    def _migrate_legacy_json(self, legacy_json_path: str):
+        """One-time import of an existing tracking.json into the database"""
+        if not legacy_json_path or not os.path.exists(legacy_json_path):
+            return
+
+        video_count = self.conn.execute('SELECT COUNT(*) FROM videos').fetchone()[0]
+        meta_count = self.conn.execute('SELECT COUNT(*) FROM meta').fetchone()[0]
+        if video_count or meta_count:
+            return  # Already migrated
+
+        with open(legacy_json_path, 'rb') as f:
+            tracking = _loads(f.read())
+
+        self.save(tracking)
+        logger.info(f"Migrated {len(tracking.get('videos', {}))} videos from {legacy_json_path}")
+
+    def load(self) -> dict:
+        """Load the full tracking dict (same shape as the old JSON file)"""
+        tracking = {'channel_url': '', 'last_scrape': None, 'videos': {}}
+
+        for key, value in self.conn.execute('SELECT key, value FROM meta'):
+            tracking[key] = _loads(value)
+
+        for video_id, data in self.conn.execute('SELECT id, data FROM videos'):
+            tracking['videos'][video_id] = _loads(data)
+
+        return tracking
+
+    def save(self, tracking: dict, video_id: str = None):
+        """
+        Persist tracking state.
+        With video_id, only that video's row is written (O(1) per event);
+        without it, meta and all video rows are upserted in one transaction.
+        """
+        now = int(time.time())
+
+        if video_id is not None:
+            self._upsert_video(video_id, tracking['videos'][video_id], now)
+        else:
+            for key in ('channel_url', 'last_scrape'):
+                self.conn.execute(
+                    'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                    (key, _dumps(tracking.get(key)))
+                )
+            for vid, data in tracking.get('videos', {}).items():
+                self._upsert_video(vid, data, now)
+
+        self.conn.commit()
+
+    def _upsert_video(self, video_id: str, data: dict, now: int):
+        self.conn.execute(
+            'INSERT INTO videos (id, data, status, updated_at) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT(id) DO UPDATE SET data=excluded.data, '
+            'status=excluded.status, updated_at=excluded.updated_at',
+            (video_id, _dumps(data), data.get('status'), now)
+        )
+
+    def close(self):
+        self.conn.close()